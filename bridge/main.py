@@ -4,7 +4,7 @@ from fastmcp import FastMCP
 from fastmcp.server.proxy import ProxyClient
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Route, Mount
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
@@ -16,24 +16,30 @@ mcp = FastMCP.as_proxy(
 
 mcp_app = mcp.http_app(transport="sse")
 
-async def wingman_endpoint(request: Request) -> JSONResponse:
+def load_wingman_data() -> dict:
     data = {
         "name": "wingman",
     }
     
-    # Read instructions from file dynamically
+    # Read instructions from file once; the file is static for the lifetime of the process
     instructions_file = Path(__file__).parent.parent / "instructions.md"
     if instructions_file.exists():
         try:
-            with open(instructions_file, 'r', encoding='utf-8') as f:
-                instructions = f.read().strip()
-                if instructions:
-                    data["instructions"] = instructions
+            instructions = instructions_file.read_text(encoding='utf-8').strip()
+            if instructions:
+                data["instructions"] = instructions
         except Exception as e:
             # If there's an error reading the file, we'll just skip adding instructions
             pass
     
-    return JSONResponse(data)
+    return data
+
+# Serialize once at startup. A fresh Response per request is still needed since
+# middleware (e.g. CORS) mutates response headers in place.
+wingman_body = JSONResponse(load_wingman_data()).body
+
+async def wingman_endpoint(request: Request) -> Response:
+    return Response(wingman_body, media_type="application/json")
 
 app = Starlette(
     routes=[
@@ -41,15 +47,28 @@ app = Starlette(
         Mount("/", app=mcp_app),
     ],
     middleware=[
+        # Explicit lists let Starlette answer preflights from precomputed headers, and
+        # max_age lets browsers cache them instead of re-sending OPTIONS for every request
         Middleware(
             CORSMiddleware,
             allow_origins=["*"],
-            allow_methods=["*"],
-            allow_headers=["*"],
-            allow_credentials=True,
+            allow_methods=["GET", "POST", "OPTIONS"],
+            allow_headers=["content-type", "authorization", "mcp-session-id", "mcp-protocol-version", "last-event-id"],
+            max_age=86400,
         )
     ]
 )
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="localhost", port=4200)
\ No newline at end of file
+    uvicorn.run(
+        app,
+        host="localhost",
+        port=4200,
+        # "auto" picks uvloop wherever it is installed (everything but Windows)
+        loop="auto",
+        http="httptools",
+        access_log=False,
+        log_level="warning",
+        server_header=False,
+        proxy_headers=False,
+    )
\ No newline at end of file
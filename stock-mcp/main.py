@@ -11,11 +11,16 @@ mcp = FastMCP(
     version="1.0.0"
 )
 
-register_stock_info(mcp)
-register_stock_history(mcp)
-register_stock_chart(mcp)
-register_stock_factsheet(mcp)
-register_stock_disclaimer(mcp)
+REGISTRARS = (
+    register_stock_info,
+    register_stock_history,
+    register_stock_chart,
+    register_stock_factsheet,
+    register_stock_disclaimer,
+)
+
+for register in REGISTRARS:
+    register(mcp)
 
 if __name__ == "__main__":
     mcp.run(transport="streamable-http")
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+from typing import Any, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from tools._cache import TTLCache
+from tools._yahoo import yf_session
+
+_ticker_cache: dict[str, yf.Ticker] = {}
+_ticker_lock = threading.Lock()
+
+_history_cache: TTLCache[pd.DataFrame] = TTLCache(maxsize=1024, ttl=300)
+
+# Intraday bars move quickly, so they are only reused for a short while
+_INTRADAY_TTL = 30
+_INTRADAY_INTERVALS = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"}
+
+# yfinance is blocking, so fetches run in worker threads; this bounds how many run at once
+_history_semaphore = asyncio.Semaphore(8)
+
+def get_ticker(symbol: str) -> yf.Ticker:
+    """Return a cached yfinance Ticker for the given symbol."""
+    sym = symbol.upper()
+
+    with _ticker_lock:
+        ticker = _ticker_cache.get(sym)
+        if ticker is None:
+            ticker = yf.Ticker(sym, session=yf_session)
+            _ticker_cache[sym] = ticker
+
+    return ticker
+
+def _history_ttl(interval: Optional[str]) -> float:
+    """Return how long history fetched at the given interval stays fresh, in seconds."""
+    return _INTRADAY_TTL if interval in _INTRADAY_INTERVALS else _history_cache.ttl
+
+async def fetch_history_with_ttl(symbol: str, params: dict[str, Any]) -> tuple[pd.DataFrame, float]:
+    """Like fetch_history, but also return how many seconds the frame stays fresh.
+
+    Anything derived from the frame can be cached for that long without outliving it.
+    Empty frames are never cached, so their remaining lifetime is 0.
+    """
+    key = (
+        symbol.upper(),
+        params.get("period"),
+        params.get("interval"),
+        params.get("start"),
+        params.get("end"),
+    )
+
+    entry = _history_cache.get_with_ttl(key)
+    if entry is not None:
+        return entry
+
+    ticker = get_ticker(symbol)
+    async with _history_semaphore:
+        hist = await asyncio.to_thread(ticker.history, **params)
+
+    # yfinance reports most failures as an empty frame; those are retried on the next call
+    if hist.empty:
+        return hist, 0.0
+
+    ttl = _history_ttl(params.get("interval"))
+    _history_cache.set(key, hist, ttl=ttl)
+
+    return hist, ttl
+
+async def fetch_history(symbol: str, params: dict[str, Any]) -> pd.DataFrame:
+    """Return Ticker.history(**params) for symbol, cached for a few minutes.
+
+    Cache misses are fetched in a worker thread so the event loop stays free.
+    The returned DataFrame is shared between callers and must not be mutated.
+    """
+    hist, _ = await fetch_history_with_ttl(symbol, params)
+    return hist
@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+def m4_downsample(frame: pd.DataFrame, width: int) -> pd.DataFrame:
+    """Reduce an OHLCV frame to at most four rows per horizontal pixel (M4 aggregation).
+
+    Rows are split into `width` equally sized buckets. From each bucket the first row,
+    the last row, the row with the lowest low and the row with the highest high are
+    kept, so the rendered chart looks the same while carrying far fewer points.
+    Expects lowercase 'low' and 'high' columns.
+    """
+    n = len(frame)
+    if n <= 4 * width:
+        return frame
+
+    bins = np.arange(n) * width // n
+
+    # bins is sorted, so every bucket is a contiguous run starting at these positions
+    firsts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+    lasts = np.r_[firsts[1:], n] - 1
+
+    # Sorting by (bucket, value) puts each bucket's extreme at its first position
+    low = frame['low'].to_numpy(dtype='float64')
+    high = frame['high'].to_numpy(dtype='float64')
+    mins = np.lexsort((low, bins))[firsts]
+    maxs = np.lexsort((-high, bins))[firsts]
+
+    keep = np.unique(np.concatenate((firsts, lasts, mins, maxs)))
+    return frame.iloc[keep]
@@ -0,0 +1,2 @@
+# Ticker symbols accepted by every tool: 1-10 uppercase letters
+SYMBOL_PATTERN = r"^[A-Z]{1,10}$"
@@ -0,0 +1,9 @@
+from curl_cffi import requests as curl_requests
+from yfinance.data import YfData
+
+# One HTTP session for every Yahoo request, so they share keep-alive connections and cookies.
+# yfinance only accepts curl_cffi sessions; otherwise each Ticker would allocate its own.
+yf_session = curl_requests.Session(impersonate="chrome")
+
+# yfinance's shared request handler on that session; it takes care of Yahoo's cookie and crumb
+yf_data = YfData(session=yf_session)
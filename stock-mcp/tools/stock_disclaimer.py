@@ -7,13 +7,7 @@ from typing_extensions import Annotated
 from fastmcp import FastMCP
 from mcp.types import EmbeddedResource, TextResourceContents
 
-def register_stock_disclaimer(mcp: FastMCP):
-    @mcp.tool(
-        name="get_disclaimer"
-    )
-    async def get_disclaimer() -> EmbeddedResource:
-        # Sample markdown disclaimer
-        markdown = """# Stock Data Disclaimer
+_DISCLAIMER_MARKDOWN = """# Stock Data Disclaimer
 
 ## Important Notice
 
@@ -44,13 +38,19 @@ By using this service, you acknowledge that:
 **Always consult with a qualified financial advisor before making investment decisions.**
 """
 
-        return EmbeddedResource(
-            type="resource",
-            
-            resource=TextResourceContents(
-                uri=f"ui://data/disclaimer.md",
-                mimeType="text/markdown",
-                text=markdown,
-            )            
-        )
-    
\ No newline at end of file
+# The disclaimer is static, so the resource is built once at import
+_DISCLAIMER_RESOURCE = EmbeddedResource(
+    type="resource",
+    resource=TextResourceContents(
+        uri="ui://data/disclaimer.md",
+        mimeType="text/markdown",
+        text=_DISCLAIMER_MARKDOWN,
+    )
+)
+
+def register_stock_disclaimer(mcp: FastMCP):
+    @mcp.tool(
+        name="get_disclaimer"
+    )
+    async def get_disclaimer() -> EmbeddedResource:
+        return _DISCLAIMER_RESOURCE
@@ -1,12 +1,48 @@
+import asyncio
 import httpx
 import base64
 
 from pydantic import Field
+from typing import Optional
 from typing_extensions import Annotated
 
 from fastmcp import FastMCP
 from mcp.types import EmbeddedResource, BlobResourceContents
 
+from tools._symbol import SYMBOL_PATTERN
+
+# Sample document served for every symbol
+PDF_URL = "https://www.adobe.com/support/products/enterprise/knowledgecenter/media/c4611_sample_explain.pdf"
+
+# Shared for the lifetime of the process so repeated downloads reuse pooled keep-alive connections
+_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    timeout=30.0,
+)
+
+# The document never changes, so it is downloaded and encoded once per process
+_pdf_base64: Optional[str] = None
+_pdf_lock = asyncio.Lock()
+
+async def _fetch_pdf_base64() -> str:
+    """Download the factsheet PDF and return it base64 encoded."""
+    # Encode while downloading so the raw PDF and its base64 copy are never both held in full
+    encoded = bytearray()
+    pending = b""
+
+    async with _client.stream("GET", PDF_URL) as response:
+        response.raise_for_status()
+
+        async for chunk in response.aiter_bytes():
+            chunk = pending + chunk
+            # base64 works on 3 byte groups; carry the rest over to the next chunk
+            cut = len(chunk) - len(chunk) % 3
+            encoded += base64.b64encode(chunk[:cut])
+            pending = chunk[cut:]
+
+    encoded += base64.b64encode(pending)
+    return encoded.decode('ascii')
+
 def register_stock_factsheet(mcp: FastMCP):
     @mcp.tool(
         name="get_factsheet"
@@ -16,20 +52,17 @@ def register_stock_factsheet(mcp: FastMCP):
             description="Stock ticker symbol (e.g., 'AAPL' for Apple, 'GOOGL' for Google, 'TSLA' for Tesla)",
             min_length=1,
             max_length=10,
-            pattern=r"^[A-Z]{1,10}$"
+            pattern=SYMBOL_PATTERN
         )]
     ) -> EmbeddedResource:
 
-        # Download the PDF from Adobe's sample document
-        pdf_url = "https://www.adobe.com/support/products/enterprise/knowledgecenter/media/c4611_sample_explain.pdf"
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(pdf_url)
-            response.raise_for_status()
-            pdf_content = response.content
-        
-        # Convert to base64
-        pdf_base64 = base64.b64encode(pdf_content).decode('utf-8')
+        global _pdf_base64
+
+        async with _pdf_lock:
+            if _pdf_base64 is None:
+                _pdf_base64 = await _fetch_pdf_base64()
+
+        pdf_base64 = _pdf_base64
 
         return EmbeddedResource(
             type="resource",
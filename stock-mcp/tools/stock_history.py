@@ -4,7 +4,8 @@ from typing import Annotated, Optional, Union, Dict
 
 from fastmcp import FastMCP
 
-import yfinance as yf
+from tools._history_cache import fetch_history
+from tools._symbol import SYMBOL_PATTERN
 
 class HistoricalBar(BaseModel):
     """Single OHLCV bar of historical price data"""
@@ -59,7 +60,7 @@ def register_stock_history(mcp: FastMCP):
             description="Stock ticker symbol (e.g., AAPL, GOOGL, TSLA)",
             min_length=1,
             max_length=10,
-            pattern=r"^[A-Z]{1,10}$"
+            pattern=SYMBOL_PATTERN
         )],
         period: Annotated[str, Field(
             description="Period: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max. Default: 1y"
@@ -79,7 +80,8 @@ def register_stock_history(mcp: FastMCP):
         Supports flexible yfinance parameters.
         Priority: start/end dates > period parameter.
         """
-        
+        sym = symbol.upper()
+
         if start is not None or end is not None:
             yf_params = {
                 "start": start,
@@ -94,37 +96,31 @@ def register_stock_history(mcp: FastMCP):
             }
             actual_period = period
 
-        stock = yf.Ticker(symbol.upper())
-
-        hist = stock.history(**yf_params)
+        hist = await fetch_history(sym, yf_params)
 
         bars: dict[date, HistoricalBar] = {}
 
         if not hist.empty:
-            for idx, row in hist.iterrows():
-                # Get date object for the key
-                if hasattr(idx, 'date'):
-                    date_key = idx.date()  # type: ignore[attr-defined]
-                elif hasattr(idx, 'to_pydatetime'):
-                    date_key = idx.to_pydatetime().date()  # type: ignore[attr-defined]
-                else:
-                    # fallback: parse string to date
-                    try:
-                        date_key = datetime.fromisoformat(str(idx)[:10]).date()
-                    except Exception:
-                        date_key = datetime.now().date()
-
-                bars[date_key] = HistoricalBar(
-                    open=row.get('Open'),
-                    high=row.get('High'),
-                    low=row.get('Low'),
-                    close=row.get('Close'),
-                    adj_close=row.get('Adj Close') if 'Adj Close' in hist.columns else None,
-                    volume=row.get('Volume')
-                )
+            # Pull each column out as a plain list once instead of boxing every cell via iterrows
+            columns = [
+                hist[name].to_numpy().tolist() if name in hist.columns else [None] * len(hist)
+                for name in ('Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume')
+            ]
+
+            # Date keys for the whole index in one pass; fall back to parsing for non-datetime indexes
+            try:
+                date_keys = hist.index.date  # type: ignore[attr-defined]
+            except AttributeError:
+                date_keys = [datetime.fromisoformat(str(idx)[:10]).date() for idx in hist.index]
+
+            # Values come straight out of the DataFrame as plain floats/ints, so skip per-bar validation
+            bars = {
+                date_key: HistoricalBar.model_construct(open=o, high=h, low=l, close=c, adj_close=a, volume=v)
+                for date_key, o, h, l, c, a, v in zip(date_keys, *columns)
+            }
 
         return HistoricalPrices(
-            symbol=symbol.upper(),
+            symbol=sym,
             resolution=period,
             period=actual_period,
             bars=bars
@@ -1,9 +1,18 @@
-from pydantic import BaseModel, Field
-from typing import Annotated, Optional, Union
+import asyncio
+import functools
+import logging
+
+from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, Optional
 
 from fastmcp import FastMCP
 
-import yfinance as yf
+from curl_cffi.requests.exceptions import RequestException
+from yfinance.exceptions import YFDataException
+
+from tools._cache import TTLCache
+from tools._symbol import SYMBOL_PATTERN
+from tools._yahoo import yf_data
 
 class StockInfo(BaseModel):
     """Comprehensive stock information model for LLM interactions"""
@@ -17,33 +26,33 @@ class StockInfo(BaseModel):
         description="Full legal name of the company"
     )
     
-    current_price: Optional[Union[float, str]] = Field(
+    current_price: Optional[float] = Field(
         default=None,
         description="Current stock price in USD"
     )
     
-    market_cap: Optional[Union[int, str]] = Field(
+    market_cap: Optional[int] = Field(
         default=None,
         description="Market capitalization in USD (total value of all shares)"
     )
     
-    pe_ratio: Optional[Union[float, str]] = Field(
+    pe_ratio: Optional[float] = Field(
         default=None,
         description="Price-to-earnings ratio (stock price divided by earnings per share)"
     )
     
-    dividend_yield: Optional[Union[float, str]] = Field(
+    dividend_yield: Optional[float] = Field(
         default=None,
-        description="Annual dividend yield as a percentage of stock price"
+        description="Annual dividend yield as a fraction of stock price (e.g., 0.0045 = 0.45%)"
     )
     
-    fifty_two_week_high: Optional[Union[float, str]] = Field(
+    fifty_two_week_high: Optional[float] = Field(
         default=None,
         description="Highest stock price in the past 52 weeks",
         alias="52_week_high"
     )
     
-    fifty_two_week_low: Optional[Union[float, str]] = Field(
+    fifty_two_week_low: Optional[float] = Field(
         default=None,
         description="Lowest stock price in the past 52 weeks",
         alias="52_week_low"
@@ -59,31 +68,57 @@ class StockInfo(BaseModel):
         description="Specific industry within the sector"
     )
     
-    volume: Optional[Union[int, str]] = Field(
+    volume: Optional[int] = Field(
         default=None,
         description="Number of shares traded today"
     )
     
-    avg_volume: Optional[Union[int, str]] = Field(
+    avg_volume: Optional[int] = Field(
         default=None,
         description="Average daily trading volume over recent period"
     )
     
-    beta: Optional[Union[float, str]] = Field(
+    beta: Optional[float] = Field(
         default=None,
         description="Stock volatility relative to market (1.0 = same as market)"
     )
     
-    book_value: Optional[Union[float, str]] = Field(
+    book_value: Optional[float] = Field(
         default=None,
         description="Book value per share (company's net worth per share)"
     )
     
-    eps: Optional[Union[float, str]] = Field(
+    eps: Optional[float] = Field(
         default=None,
         description="Earnings per share (company's profit divided by number of shares)"
     )
 
+    @field_validator(
+        'current_price', 'pe_ratio', 'dividend_yield', 'fifty_two_week_high',
+        'fifty_two_week_low', 'beta', 'book_value', 'eps',
+        mode='before'
+    )
+    @classmethod
+    def _coerce_float(cls, value: Any) -> Optional[float]:
+        """Accept numeric strings from Yahoo and treat unparsable values as missing."""
+        if value is None or isinstance(value, float):
+            return value
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    @field_validator('market_cap', 'volume', 'avg_volume', mode='before')
+    @classmethod
+    def _coerce_int(cls, value: Any) -> Optional[int]:
+        """Accept numeric strings and floats from Yahoo and treat unparsable values as missing."""
+        if value is None or isinstance(value, int):
+            return value
+        try:
+            return int(float(value)) if isinstance(value, str) else int(value)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
     model_config = {
         "populate_by_name": True,
         "json_schema_extra": {
@@ -107,6 +142,105 @@ class StockInfo(BaseModel):
         }
     }
 
+QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/"
+# Only the modules holding StockInfo fields
+QUOTE_SUMMARY_MODULES = ("price", "summaryDetail", "defaultKeyStatistics")
+# Company metadata rarely changes, so these are fetched once per symbol and process
+QUOTE_SUMMARY_STATIC_MODULES = ("quoteType", "assetProfile")
+
+# StockInfo field name -> (quoteSummary module, key). Several keys appear in more than one
+# module, so each field names the one it is read from.
+_FIELD_MAP = (
+    ('current_price', 'price', 'regularMarketPrice'),
+    ('market_cap', 'summaryDetail', 'marketCap'),
+    ('pe_ratio', 'summaryDetail', 'trailingPE'),
+    ('dividend_yield', 'summaryDetail', 'dividendYield'),
+    ('fifty_two_week_high', 'summaryDetail', 'fiftyTwoWeekHigh'),
+    ('fifty_two_week_low', 'summaryDetail', 'fiftyTwoWeekLow'),
+    ('volume', 'summaryDetail', 'volume'),
+    ('avg_volume', 'summaryDetail', 'averageVolume'),
+    ('beta', 'summaryDetail', 'beta'),
+    ('book_value', 'defaultKeyStatistics', 'bookValue'),
+    ('eps', 'defaultKeyStatistics', 'trailingEps'),
+)
+
+_STATIC_FIELD_MAP = (
+    ('company_name', 'quoteType', 'longName'),
+    ('sector', 'assetProfile', 'sector'),
+    ('industry', 'assetProfile', 'industry'),
+)
+
+def _fetch_fields(sym: str, modules: tuple[str, ...], field_map: tuple[tuple[str, str, str], ...]) -> dict[str, Any]:
+    """Fetch the given quoteSummary modules for sym and pick out the mapped StockInfo fields."""
+    data = yf_data.get_raw_json(QUOTE_SUMMARY_URL + sym, params={
+        "modules": ",".join(modules),
+        "formatted": "false",
+        "symbol": sym,
+    })
+
+    # An unknown symbol can come back as a null result plus an error instead of an HTTP error.
+    # Raise so that nothing empty lands in the caches.
+    summary = data.get("quoteSummary") or {}
+    if summary.get("error") or not summary.get("result"):
+        error = summary.get("error") or {}
+        raise YFDataException(f"{sym}: {error.get('description') or 'no quoteSummary data'}")
+
+    result = summary["result"][0]
+
+    fields = {}
+    for field, module, key in field_map:
+        values = result.get(module)
+        fields[field] = values.get(key) if isinstance(values, dict) else None
+
+    return fields
+
+def _fetch_sync(sym: str) -> dict[str, Any]:
+    """Fetch the price and key statistics fields for sym."""
+    return _fetch_fields(sym, QUOTE_SUMMARY_MODULES, _FIELD_MAP)
+
+@functools.lru_cache(maxsize=2048)
+def _fetch_static(sym: str) -> tuple[tuple[str, Optional[str]], ...]:
+    """Fetch the company name, sector and industry fields for sym, memoized for the lifetime of the process."""
+    return tuple(_fetch_fields(sym, QUOTE_SUMMARY_STATIC_MODULES, _STATIC_FIELD_MAP).items())
+
+# Quotes barely move within a minute, so repeated lookups are answered from memory
+_info_cache: TTLCache[StockInfo] = TTLCache(maxsize=1024, ttl=60)
+
+# Bounds how many Yahoo requests a batch lookup runs at once
+_info_semaphore = asyncio.Semaphore(16)
+
+logger = logging.getLogger(__name__)
+
+async def _get_stock_info(sym: str) -> StockInfo:
+    """Return StockInfo for an uppercase symbol, from the cache when fresh."""
+    cached = _info_cache.get(sym)
+    if cached is not None:
+        return cached
+
+    # The requests block, so they run in worker threads to keep the event loop free
+    static, info = await asyncio.gather(
+        asyncio.to_thread(_fetch_static, sym),
+        asyncio.to_thread(_fetch_sync, sym),
+    )
+    
+    payload = {'symbol': sym}
+    payload.update(static)
+    payload.update(info)
+    result = StockInfo.model_validate(payload)
+
+    _info_cache.set(sym, result)
+
+    return result
+
+async def _get_stock_info_or_empty(sym: str) -> StockInfo:
+    """Like _get_stock_info, but a failed request or missing data yields a StockInfo with only the symbol set."""
+    try:
+        async with _info_semaphore:
+            return await _get_stock_info(sym)
+    except (RequestException, YFDataException) as e:
+        logger.warning("stock info lookup for %s failed: %s", sym, e)
+        return StockInfo(symbol=sym)
+
 def register_stock_info(mcp: FastMCP):
     @mcp.tool(
         name="get_stock_info",
@@ -118,7 +252,7 @@ def register_stock_info(mcp: FastMCP):
             description="Stock ticker symbol (e.g., 'AAPL' for Apple, 'GOOGL' for Google, 'TSLA' for Tesla)",
             min_length=1,
             max_length=10,
-            pattern=r"^[A-Z]{1,10}$"
+            pattern=SYMBOL_PATTERN
         )]
     ) -> StockInfo:
         """
@@ -137,22 +271,34 @@ def register_stock_info(mcp: FastMCP):
         Returns:
             StockInfo: Comprehensive stock data in a structured format
         """
-        stock = yf.Ticker(symbol.upper())
+        return await _get_stock_info(symbol.upper())
+
+    @mcp.tool(
+        name="get_stock_infos",
+        title="Get Stock Information (Batch)",
+        description="Get comprehensive stock information for several publicly traded companies at once using their ticker symbols"
+    )
+    async def get_stock_infos(
+        symbols: Annotated[list[Annotated[str, Field(
+            min_length=1,
+            max_length=10,
+            pattern=SYMBOL_PATTERN
+        )]], Field(
+            description="Stock ticker symbols (e.g., ['AAPL', 'GOOGL', 'TSLA'])",
+            min_length=1,
+            max_length=50
+        )]
+    ) -> list[StockInfo]:
+        """
+        Fetch comprehensive stock market data for several ticker symbols concurrently.
+        
+        Returns the same data as get_stock_info for each symbol, in the order given.
+        Symbols that cannot be looked up are returned with only the symbol set.
         
-        return StockInfo(
-            symbol=symbol.upper(),
-            company_name=stock.info.get('longName'),
-            current_price=stock.info.get('currentPrice'),
-            market_cap=stock.info.get('marketCap'),
-            pe_ratio=stock.info.get('trailingPE'),
-            dividend_yield=stock.info.get('dividendYield'),
-            **{"52_week_high": stock.info.get('fiftyTwoWeekHigh')},
-            **{"52_week_low": stock.info.get('fiftyTwoWeekLow')},
-            sector=stock.info.get('sector'),
-            industry=stock.info.get('industry'),
-            volume=stock.info.get('volume'),
-            avg_volume=stock.info.get('averageVolume'),
-            beta=stock.info.get('beta'),
-            book_value=stock.info.get('bookValue'),
-            eps=stock.info.get('trailingEps')
-        )
+        Args:
+            symbols: Stock ticker symbols (will be converted to uppercase)
+        
+        Returns:
+            list[StockInfo]: Stock data for each requested symbol
+        """
+        return await asyncio.gather(*(_get_stock_info_or_empty(s.upper()) for s in symbols))